@@ -56,9 +56,15 @@ and robust background task handling as of this version.
 
 
 import os
+import re
 import sys
+import atexit
+import json
+import math
 import logging
+import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Dict, Any, Tuple
@@ -74,8 +80,32 @@ from PIL import Image, ImageTk, ImageColor
 from pycoingecko import CoinGeckoAPI
 import sv_ttk
 import requests
+import random
 import time
 
+try:
+    import orjson  # optional: ~2-5x faster than stdlib json on float-heavy payloads
+except ImportError:
+    orjson = None
+
+def _closest_index(prices: np.ndarray, target: float) -> int:
+    """Index of the price closest to target (ties go to the first match)."""
+    best = 0
+    bd = abs(prices[0] - target)
+    for i in range(1, prices.size):
+        d = abs(prices[i] - target)
+        if d < bd:
+            bd = d; best = i
+    return best
+
+try:
+    from numba import njit  # optional: compiles the scan to machine code
+    _closest_index = njit("int64(float64[:], float64)", cache=True)(_closest_index)
+except ImportError:
+    # NumPy fallback: two temporaries, but still C-speed for our row counts.
+    def _closest_index(prices: np.ndarray, target: float) -> int:
+        return int(np.abs(prices - target).argmin())
+
 # -----------------------------------------------------------------------------
 # Logging
 # -----------------------------------------------------------------------------
@@ -103,6 +133,7 @@ BUTTON_BG = "#00C4B4"
 BUTTON_FG = "#FFFFFF"
 
 LOGO_PATH = resource_path(os.path.join("pics", "Kaspa-LDSP-Dark-Reverse.png"))
+LOGO_PATH_SCALED = resource_path(os.path.join("pics", "Kaspa-LDSP-Dark-Reverse_300x125.png"))
 LOGO_PATH_LIGHT = resource_path(os.path.join("pics", "Kaspa-LDSP-Dark-Full-Color.png"))
 ICON_PATH = resource_path(os.path.join("pics", "kaspa.ico"))
 
@@ -116,20 +147,75 @@ DEFAULTS = {"Portfolio Name:": "", "KAS Holdings:": "0", "Current Price (USD):":
 NUMERIC_FIELDS = ["KAS Holdings:", "Current Price (USD):", "Circulating Supply (B):"]
 
 # FX defaults used until/if live rates arrive
+SUPPORTED_CURRENCIES = ["USD", "EUR", "GBP", "JPY", "AUD"]
 EXCHANGE_RATES = {"USD": 1.0, "EUR": 0.92, "GBP": 0.79, "JPY": 149.50, "AUD": 1.55}
 CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥", "AUD": "A$"}
 
+# Index-keyed rate array for hot paths: conversions hit a fixed ndarray slot
+# instead of an upper()+dict lookup per call. USD sits at index 0 (rate 1.0),
+# which doubles as the fallback for unknown codes.
+_RATE_INDEX = {c: i for i, c in enumerate(SUPPORTED_CURRENCIES)}
+_RATES_ARR = np.array([EXCHANGE_RATES[c] for c in SUPPORTED_CURRENCIES], dtype=np.float64)
+
+def _update_exchange_rates(rates: Dict[str, float]) -> None:
+    """Apply fresh FX rates to both the dict and the indexed array, in place."""
+    EXCHANGE_RATES.update(rates)
+    for code, value in rates.items():
+        idx = _RATE_INDEX.get(code.upper())
+        if idx is not None:
+            _RATES_ARR[idx] = value
+
+# Strips any supported currency symbol plus thousands separators. Multi-char
+# symbols ("A$") go through one regex sub; the single-char remainder is a
+# str.translate deletion table, a direct per-char lookup in C.
+_CURRENCY_MULTI_RE = re.compile(r"A\$")
+_CURRENCY_SINGLE_TABLE = str.maketrans("", "", "$€£¥,")
+
+def _strip_currency(text: str) -> str:
+    return _CURRENCY_MULTI_RE.sub("", text).translate(_CURRENCY_SINGLE_TABLE)
+
 def currency_symbol(code: str) -> str:
     return CURRENCY_SYMBOLS.get(code.upper(), "$")
 
+def _load_scaled_logo(path: str, size: Tuple[int, int]) -> "ImageTk.PhotoImage":
+    """Resize `path` to `size`, caching the result on disk keyed by source mtime.
+
+    The cache lives in the temp dir so frozen builds (read-only _MEIPASS) can
+    still write it; a stale or unwritable cache just falls back to resampling.
+    """
+    cache = os.path.join(tempfile.gettempdir(), f"kpp_logo_{size[0]}x{size[1]}.png")
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(path):
+            return ImageTk.PhotoImage(Image.open(cache))
+    except OSError:
+        pass
+    img = Image.open(path).resize(size, Image.LANCZOS)
+    try:
+        img.save(cache)
+    except OSError:
+        pass
+    return ImageTk.PhotoImage(img)
+
 def fmt_money(symbol: str, value: float, decimals: int = 2) -> str:
     return f"{symbol}{value:,.{decimals}f}"
 
+@lru_cache(maxsize=32)
+def _money_formatter(symbol: str, decimals: int = 2):
+    # Pre-bound str.format for one (symbol, decimals) pair: hot loops call it
+    # directly instead of re-entering fmt_money and re-parsing an f-string spec.
+    return f"{symbol}{{:,.{decimals}f}}".format
+
+def _fmt_money_array(symbol: str, arr, decimals: int = 2) -> list:
+    # Batch counterpart of fmt_money: one list comprehension over plain floats
+    # instead of a Series.map closure dispatching per element.
+    fmt = _money_formatter(symbol, decimals)
+    return [fmt(v) for v in np.asarray(arr, dtype=np.float64).tolist()]
+
 def usd_to_disp(value_usd: float, currency: str) -> float:
-    return value_usd * EXCHANGE_RATES.get(currency.upper(), 1.0)
+    return value_usd * _RATES_ARR[_RATE_INDEX.get(currency.upper(), 0)]
 
 def disp_to_usd(value_disp: float, currency: str) -> float:
-    rate = EXCHANGE_RATES.get(currency.upper(), 1.0)
+    rate = _RATES_ARR[_RATE_INDEX.get(currency.upper(), 0)]
     return value_disp / rate if rate else 0.0
 
 # -----------------------------------------------------------------------------
@@ -201,117 +287,256 @@ def section_title(parent, text: str):
 # Gradient header utilities
 # -----------------------------------------------------------------------------
 def _lerp(a, b, t): return int(a + (b - a) * t)
+
+@lru_cache(maxsize=64)
 def _hex_to_rgb(hx): return ImageColor.getrgb(hx)
 
-def make_horizontal_gradient(width, height, stops):
-    img = Image.new("RGB", (width, height))
-    px = img.load()
+@lru_cache(maxsize=8)
+def _gradient_cached(width, height, stops):
     stops = sorted(stops, key=lambda s: s[0])
-    for x in range(width):
-        t = x / max(1, width - 1)
-        for i in range(len(stops) - 1):
-            p0, c0 = stops[i]
-            p1, c1 = stops[i + 1]
-            if p0 <= t <= p1:
-                local = 0 if p1 == p0 else (t - p0) / (p1 - p0)
-                r0, g0, b0 = _hex_to_rgb(c0); r1, g1, b1 = _hex_to_rgb(c1)
-                r = _lerp(r0, r1, local); g = _lerp(g0, g1, local); b = _lerp(b0, b1, local)
-                for y in range(height): px[x, y] = (r, g, b)
-                break
-    return img
+    xs = np.array([p * max(1, width - 1) for p, _ in stops], dtype=np.float64)
+    rgb = np.array([_hex_to_rgb(c) for _, c in stops], dtype=np.float64)
+    x = np.arange(width)
+    # One np.interp per channel over the x axis, broadcast down the height —
+    # replaces the W*H per-pixel Python loop with three C-level interpolations.
+    row = np.stack([np.interp(x, xs, rgb[:, ch]) for ch in range(3)], axis=-1).astype(np.uint8)
+    arr = np.ascontiguousarray(np.broadcast_to(row, (height, width, 3)))
+    return Image.fromarray(arr, "RGB")
+
+def make_horizontal_gradient(width, height, stops):
+    return _gradient_cached(width, height, tuple(stops))
 
 # -----------------------------------------------------------------------------
 # API helpers
 # -----------------------------------------------------------------------------
+# Shared worker pool for background fetches so network latency overlaps with
+# Tk widget construction instead of waiting for the UI to finish building.
+_GLOBAL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kpp")
+atexit.register(_GLOBAL_POOL.shutdown, wait=False, cancel_futures=True)
+
+# Shared HTTP session: keep-alive sockets amortize TCP+TLS setup across the
+# FX fetch, retries, and refreshes instead of opening a fresh connection each time.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.headers.update({"User-Agent": f"KPP/{VERSION}", "Accept": "application/json"})
+
 def fetch_fx_rates(retries: int = 2, timeout: int = 8) -> Dict[str, Any]:
     fetched_at = datetime.now(timezone.utc).isoformat()
     source = "exchangerate.host/latest (base=USD)"
     params = {"base": "USD", "symbols": "USD,EUR,GBP,JPY,AUD"}
+    # Exponential backoff with jitter, capped by a total budget so the worst
+    # case stays bounded and simultaneous retries don't hammer the endpoint.
+    deadline = time.monotonic() + 6.0
+    delay = 0.2
     for attempt in range(retries + 1):
         try:
-            r = requests.get("https://api.exchangerate.host/latest", params=params, timeout=timeout)
+            r = _SESSION.get("https://api.exchangerate.host/latest", params=params, timeout=timeout)
             r.raise_for_status()
-            data = r.json()
+            data = orjson.loads(r.content) if orjson is not None else r.json()
             rates = data.get("rates", {})
-            out = {k: float(rates.get(k, EXCHANGE_RATES[k])) for k in ["USD", "EUR", "GBP", "JPY", "AUD"]}
+            out = {k: float(rates.get(k, EXCHANGE_RATES[k])) for k in SUPPORTED_CURRENCIES}
             for k, v in out.items():
                 if v <= 0: out[k] = EXCHANGE_RATES[k]
             return {"rates": out, "fetched_at": fetched_at, "source": source}
         except Exception as e:
             logger.warning(f"FX fetch attempt {attempt+1} failed: {e}")
-            if attempt < retries:
-                time.sleep(0.5)
+            if attempt >= retries or time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay + random.uniform(0, delay))
+            delay *= 2
     return {"rates": EXCHANGE_RATES.copy(), "fetched_at": fetched_at, "source": source + " (fallback used)"}
 
-def _safe_get(fn, *a, **kw):
+# TTL cache for API snapshots. Unlike lru_cache, a failed/empty fetch is never
+# pinned for the process lifetime, and market data goes stale after the TTL.
+_API_CACHE: Dict[str, Any] = {"data": None, "ts": 0.0}
+_API_CACHE_LOCK = threading.Lock()
+_API_CACHE_TTL = 300.0  # seconds
+
+def _clear_api_cache():
+    with _API_CACHE_LOCK:
+        _API_CACHE["data"] = None
+        _API_CACHE["ts"] = 0.0
+
+# On-disk snapshot for stale-while-revalidate: warm starts render the last
+# known data instantly and the network fetch only refreshes it.
+_API_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".kpp_cache.json")
+
+def _save_api_cache_to_disk(data: Dict[str, Any]) -> None:
+    try:
+        tmp = _API_CACHE_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"ts": time.time(), "data": data}, f)
+        os.replace(tmp, _API_CACHE_PATH)
+    except Exception as e:
+        logger.warning(f"Could not persist API cache: {e}")
+
+def _load_api_cache_from_disk() -> Dict[str, Any] | None:
+    try:
+        with open(_API_CACHE_PATH, encoding="utf-8") as f:
+            payload = json.load(f)
+        data = payload.get("data") or {}
+        if "kaspa_price" in data:
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Could not read API cache: {e}")
+    return None
+
+def _safe_get(fn, *a, retries: int = 2, **kw):
+    # Same bounded backoff-with-jitter shape as fetch_fx_rates: transient
+    # failures (429s, timeouts) are absorbed here instead of surfacing a
+    # dialog that invites the user to hammer Fetch again.
+    delay = 0.3
+    for attempt in range(retries + 1):
+        try:
+            return fn(*a, **kw)
+        except Exception as e:
+            logger.warning(f"pycoingecko call failed (attempt {attempt+1}): {e}")
+            if attempt >= retries:
+                return None
+            time.sleep(delay + random.uniform(0, delay))
+            delay *= 2
+
+def _fetch_coingecko() -> Dict[str, Any]:
+    """Fetch KAS price/supply and BTC market cap in one batched /simple/price call.
+
+    Circulating supply is derived as market_cap / price from the same response
+    (CoinGecko computes the cap as price x supply, so this recovers it), which
+    avoids the ~100 KB /coins/kaspa metadata download; that heavier call stays
+    as a fallback when the cap is missing from the response.
+    """
+    out: Dict[str, Any] = {}
     try:
-        return fn(*a, **kw)
+        cg = CoinGeckoAPI()
+        data = _safe_get(cg.get_price, ids="kaspa,bitcoin", vs_currencies="usd",
+                         include_market_cap=True)
+        _f = float  # local bind; this sits on the fetch critical path
+        kas = (data or {}).get("kaspa") or {}
+        btc = (data or {}).get("bitcoin") or {}
+        if kas.get("usd"):
+            out["kaspa_price"] = _f(kas["usd"])
+            if kas.get("usd_market_cap"):
+                out["kaspa_supply"] = _f(kas["usd_market_cap"]) / out["kaspa_price"]
+        if "kaspa_supply" not in out:
+            supply = _safe_get(cg.get_coin_by_id, id="kaspa")
+            if supply and "market_data" in supply:
+                out["kaspa_supply"] = _f(supply["market_data"]["circulating_supply"])
+        if btc.get("usd_market_cap"):
+            out["btc_market_cap"] = _f(btc["usd_market_cap"])
+        out["coingecko_fetched_at"] = datetime.now(timezone.utc).isoformat()
+        out["coingecko_source"] = "CoinGecko API"
     except Exception as e:
-        logger.warning(f"pycoingecko call failed: {e}")
-        return None
+        logger.error(f"CoinGecko fetch failed: {e}")
+    return out
 
 # -----------------------------------------------------------------------------
 # Projection math
 # -----------------------------------------------------------------------------
-def generate_price_intervals(current_price_usd: float, min_price: float = 0.01, max_price: float = 1000.0):
-    cp = round(max(current_price_usd, 0.01), 2)
+@lru_cache(maxsize=64)
+def _price_intervals_cached(cp_cents: int, min_price: float, max_price: float) -> Tuple[float, ...]:
+    cp = cp_cents / 100.0
     red_max = max(min(cp - 0.01, cp), min_price)
     red_intervals = np.linspace(min_price, red_max, num=9).tolist() if red_max > min_price else []
     black = [cp]
     green_start = round(cp + 0.01, 2)
     green_intervals = [] if green_start >= max_price else np.geomspace(green_start, max_price, num=240).tolist()
-    return sorted({round(x, 2) for x in (red_intervals + black + green_intervals)})
+    # Dedup+sort in C via np.unique; rounding stays Python round() because
+    # np.round lands on different cents for decimal ties (see projection note).
+    pts = red_intervals + black + green_intervals
+    arr = np.fromiter((round(x, 2) for x in pts), dtype=np.float64, count=len(pts))
+    return tuple(np.unique(arr).tolist())
+
+def generate_price_intervals(current_price_usd: float, min_price: float = 0.01, max_price: float = 1000.0):
+    # The grid depends only on the price rounded to cents, so slider nudges and
+    # currency changes at the same price hit the cache instead of regenerating.
+    cp_cents = int(round(round(max(current_price_usd, 0.01), 2) * 100))
+    return _price_intervals_cached(cp_cents, min_price, max_price)
 
 def generate_portfolio_projection(kas_amount: float, current_price_usd: float,
                                   circ_supply_b: float, currency: str):
     circ_supply = circ_supply_b * 1_000_000_000
-    usd_prices = generate_price_intervals(current_price_usd)
+    usd = np.asarray(generate_price_intervals(current_price_usd), dtype=np.float64)
     rate = EXCHANGE_RATES.get(currency.upper(), 1.0)
-    colors = ["red" if p < round(current_price_usd, 2)
-              else "black" if p == round(current_price_usd, 2)
-              else "green" for p in usd_prices]
-    display_prices = [round(p * rate, 2) for p in usd_prices]
-    portfolios = [kas_amount * p * rate for p in usd_prices]
-    market_caps = [circ_supply * p * rate for p in usd_prices]
-
-    black_idx = colors.index("black")
-    black_disp = display_prices[black_idx]
-
-    def dedupe(indices):
-        rows = [(display_prices[i], usd_prices[i], portfolios[i], market_caps[i], colors[i]) for i in indices]
-        rows.sort(key=lambda x: (x[0], x[1]))
-        seen, out = set(), []
-        for r in rows:
-            if r[0] not in seen:
-                seen.add(r[0]); out.append(r)
-        return out
+    # Quantize exactly like the interval builder so cp always sits in the grid.
+    cp = round(max(current_price_usd, 0.01), 2)
+    colors = np.where(usd < cp, "red", np.where(usd == cp, "black", "green"))
+    # Python round(), not np.round: the latter rounds the scaled binary value and
+    # lands on a different cent for ties (e.g. 1.185 -> 1.18), shifting rows.
+    disp = np.fromiter((round(x, 2) for x in (usd * rate).tolist()), dtype=np.float64, count=usd.size)
+    port = kas_amount * usd * rate
+    mcap = circ_supply * usd * rate
+
+    # The grid is sorted and unique with cp guaranteed present, so the black
+    # row's position falls out of a binary search — no string-array scan.
+    black_idx = int(np.searchsorted(usd, cp))
+    black_disp = disp[black_idx]
 
     if currency.upper() != "USD":
-        red = dedupe(range(0, black_idx))
-        if red and red[-1][0] == black_disp: red.pop()
-        green = dedupe(range(black_idx + 1, len(usd_prices)))
-        if green and green[0][0] == black_disp: green.pop(0)
-        merged = red + [(display_prices[black_idx], usd_prices[black_idx], portfolios[black_idx],
-                         market_caps[black_idx], colors[black_idx])] + green
-        if merged:
-            disp, usd, port, mcap, cols = zip(*merged)
-        else:
-            disp, usd, port, mcap, cols = [], [], [], [], []
-    else:
-        disp, usd, port, mcap, cols = display_prices, usd_prices, portfolios, market_caps, colors
-
-    df = pd.DataFrame({"Price": disp, "Price_USD": usd, "Portfolio": port, "Market Cap": mcap, "Color": cols})
+        # Display prices collapse onto fewer cents after conversion; keep the first
+        # (lowest-USD) row per display price on each side of the black row, and
+        # never let a red/green duplicate shadow the black row itself.
+        _, red_sel = np.unique(disp[:black_idx], return_index=True)
+        if red_sel.size and disp[red_sel[-1]] == black_disp:
+            red_sel = red_sel[:-1]
+        _, green_sel = np.unique(disp[black_idx + 1:], return_index=True)
+        green_sel = green_sel + black_idx + 1
+        if green_sel.size and disp[green_sel[0]] == black_disp:
+            green_sel = green_sel[1:]
+        sel = np.concatenate([red_sel, [black_idx], green_sel]).astype(np.intp)
+        disp, usd, port, mcap, colors = disp[sel], usd[sel], port[sel], mcap[sel], colors[sel]
+
+    df = pd.DataFrame({"Price": disp, "Price_USD": usd, "Portfolio": port, "Market Cap": mcap, "Color": colors})
     return df, currency_symbol(currency)
 
+@lru_cache(maxsize=32)
+def _projection_memo(kas_amount, current_price_usd, circ_supply_b, currency, _rate):
+    # _rate is only part of the key: it pins the fx snapshot so a rate refresh
+    # naturally misses instead of serving stale conversions.
+    return generate_portfolio_projection(kas_amount, current_price_usd, circ_supply_b, currency)
+
+def cached_portfolio_projection(kas_amount: float, current_price_usd: float,
+                                circ_supply_b: float, currency: str):
+    """Memoized projection for repeated calls with unchanged inputs.
+
+    Callers must treat the returned DataFrame as read-only.
+    """
+    rate = EXCHANGE_RATES.get(currency.upper(), 1.0)
+    return _projection_memo(kas_amount, current_price_usd, circ_supply_b, currency, rate)
+
 # -----------------------------------------------------------------------------
 # PDF
 # -----------------------------------------------------------------------------
+# Parsed logo image info, filled on the first export and reused afterwards.
+_PDF_LOGO_CACHE: Dict[str, Any] = {}
+
+# Row-color names to the RGB triples used in the PDF table.
+_PDF_COLOR_RGB = {"red": (200, 0, 0), "green": (0, 140, 70), "black": (20, 20, 20)}
+
+# Rendered PDF bytes keyed by the full input tuple, so clicking Generate twice
+# with unchanged inputs rewrites the file without re-rendering. Small cap: a
+# document is a few hundred KB.
+_PDF_BYTES_CACHE: Dict[tuple, bytes] = {}
+_PDF_BYTES_CACHE_MAX = 4
+
 def generate_portfolio_pdf(df, filename, title, kas_amount, current_price_usd,
                            circ_supply_b, currency, btc_market_cap, progress_cb=None):
     formatted_title = (title.capitalize() + " Portfolio Projection") if title else "Unnamed Portfolio Projection"
     rate = EXCHANGE_RATES.get(currency.upper(), 1.0)
     sym = currency_symbol(currency)
 
+    # The date appears in the header, so it belongs in the key.
+    cache_key = (title, kas_amount, current_price_usd, circ_supply_b,
+                 currency.upper(), btc_market_cap, rate,
+                 datetime.now(timezone.utc).strftime("%B %d, %Y"))
+    cached = _PDF_BYTES_CACHE.get(cache_key)
+    if cached is not None:
+        with open(filename, "wb") as f:
+            f.write(cached)
+        if progress_cb:
+            progress_cb(100.0)
+        return
+
     circ_supply = circ_supply_b * 1_000_000_000
     market_cap = current_price_usd * circ_supply * rate
     portfolio_value = kas_amount * current_price_usd * rate
@@ -325,7 +550,18 @@ def generate_portfolio_pdf(df, filename, title, kas_amount, current_price_usd,
     pdf = FPDF()
     pdf.set_auto_page_break(auto=False, margin=12)
     pdf.add_page()
-    try: pdf.image(LOGO_PATH_LIGHT, x=10, y=6, w=50)
+    try:
+        # Seed FPDF's per-instance image cache with the logo parsed on the
+        # first export, so later PDFs skip the PNG decode. The copy matters:
+        # output() writes object numbers into the info dict.
+        if _PDF_LOGO_CACHE:
+            pdf.images[LOGO_PATH_LIGHT] = dict(_PDF_LOGO_CACHE)
+            if "smask" in _PDF_LOGO_CACHE and pdf.pdf_version < "1.4":
+                # Parsing normally bumps the version for alpha; mirror that.
+                pdf.pdf_version = "1.4"
+        pdf.image(LOGO_PATH_LIGHT, x=10, y=6, w=50)
+        if not _PDF_LOGO_CACHE:
+            _PDF_LOGO_CACHE.update(pdf.images[LOGO_PATH_LIGHT])
     except Exception: pass
 
     pdf.set_font("Helvetica", "B", 22)
@@ -377,8 +613,7 @@ def generate_portfolio_pdf(df, filename, title, kas_amount, current_price_usd,
     header_bg = (230, 230, 230)
     row_fill_a = (248, 248, 248)
     row_fill_b = (255, 255, 255)
-    text_norm = (20, 20, 20)
-    red = (200, 0, 0); green = (0, 140, 70); black = text_norm
+    text_norm = _PDF_COLOR_RGB["black"]
 
     def table_header():
         pdf.set_font("Helvetica", "B", 11)
@@ -389,29 +624,51 @@ def generate_portfolio_pdf(df, filename, title, kas_amount, current_price_usd,
         pdf.ln()
         pdf.set_font("Helvetica", "", 10)
 
+    cur_color = None  # last color passed to set_text_color, to skip no-op calls
+
     def page_break_if_needed():
+        nonlocal cur_color
         if pdf.get_y() > 265:
-            pdf.add_page(); table_header()
+            pdf.add_page(); table_header(); cur_color = text_norm
 
     table_header()
     total = len(df)
-    for i, (_, row) in enumerate(df.iterrows(), 1):
+    # Format all cell strings up front and iterate plain arrays; iterrows would
+    # box every row into a Series just to read four values.
+    price_strs = [f"{sym}{v:,.2f}" for v in df["Price"].to_numpy()]
+    port_strs = [f"{sym}{v:,.2f}" for v in df["Portfolio"].to_numpy()]
+    mcap_strs = [f"{sym}{v:,.2f}" for v in df["Market Cap"].to_numpy()]
+    color_map = _PDF_COLOR_RGB
+    progress_step = max(1, total // 100)
+    # Pre-bind the FPDF methods and alternate fills by parity; saves hundreds of
+    # attribute lookups and a branch per row in the tightest loop of the export.
+    set_fill = pdf.set_fill_color; set_text = pdf.set_text_color
+    cell = pdf.cell; ln = pdf.ln
+    fills = (row_fill_a, row_fill_b)
+    for i, (pstr, qstr, mstr, col) in enumerate(
+            zip(price_strs, port_strs, mcap_strs, df["Color"].to_numpy()), 1):
         page_break_if_needed()
-        fill_color = row_fill_a if i % 2 == 0 else row_fill_b
-        pdf.set_fill_color(*fill_color)
-        color = red if row["Color"] == "red" else green if row["Color"] == "green" else black
-        pdf.set_text_color(*color)
-        pdf.cell(63, 8, f"{sym}{row['Price']:,.2f}", border=1, align="C", fill=True)
-        pdf.set_text_color(*text_norm)
-        pdf.cell(63, 8, f"{sym}{row['Portfolio']:,.2f}", border=1, align="C", fill=True)
-        pdf.cell(63, 8, f"{sym}{row['Market Cap']:,.2f}", border=1, align="C", fill=True)
-        pdf.ln()
-        if progress_cb and total:
+        set_fill(*fills[i & 1])
+        c = color_map[col]
+        if c is not cur_color:
+            set_text(*c); cur_color = c
+        cell(63, 8, pstr, border=1, align="C", fill=True)
+        if cur_color is not text_norm:
+            set_text(*text_norm); cur_color = text_norm
+        cell(63, 8, qstr, border=1, align="C", fill=True)
+        cell(63, 8, mstr, border=1, align="C", fill=True)
+        ln()
+        if progress_cb and (i % progress_step == 0 or i == total):
             progress_cb(i * 100.0 / total)
 
     pdf.set_y(-10); pdf.set_text_color(0, 0, 0); pdf.set_font("Helvetica", "", 7)
     pdf.cell(0, 5, "Generated by Kaspa Portfolio Projector (KPP)", 0, 0, "C")
-    pdf.output(filename)
+    data = pdf.output(dest="S").encode("latin-1")
+    if len(_PDF_BYTES_CACHE) >= _PDF_BYTES_CACHE_MAX:
+        _PDF_BYTES_CACHE.pop(next(iter(_PDF_BYTES_CACHE)))
+    _PDF_BYTES_CACHE[cache_key] = data
+    with open(filename, "wb") as f:
+        f.write(data)
 
 # -----------------------------------------------------------------------------
 # Main App
@@ -419,6 +676,9 @@ def generate_portfolio_pdf(df, filename, title, kas_amount, current_price_usd,
 class KaspaPortfolioApp:
     def __init__(self, root):
         self.root = root
+        # Kick off the network fetch immediately so it overlaps widget construction;
+        # the result is applied once the UI below exists.
+        self._startup_future = _GLOBAL_POOL.submit(self.fetch_api_data)
         self.root.title(f"Kaspa Portfolio Projection (KPP) - Version {VERSION}")
         self.root.geometry("1700x1005")
         self.root.minsize(1300, 850)
@@ -426,9 +686,46 @@ class KaspaPortfolioApp:
         except Exception: pass
 
         apply_modern_style(self.root)
+
+        # Writing a readonly entry takes four widget commands; a Tcl proc does
+        # all four in one interpreter crossing per entry.
+        self.root.tk.eval(
+            "proc kpp_writeRO {w v} { $w state !readonly; $w delete 0 end;"
+            " $w insert 0 $v; $w state readonly }")
         self._debounce_after = None
+        self._pending_status_text: str | None = None
+        self._pending_status_value: float | None = None
+        self._status_scheduled = False
         self.fetched_data: Dict[str, Any] = {}
         self._sort_state: Dict[str, bool] = {}
+        # Per-currency projection cache; valid only for the current numeric inputs
+        # and FX snapshot, so re-selecting a currency skips the O(N) rebuild.
+        self._proj_by_ccy: Dict[str, Tuple[pd.DataFrame, str]] = {}
+        self._proj_inputs: Tuple[float, float, float] | None = None
+        # Numeric columns parallel to the Treeview rows (display order), so
+        # sorting and the slider's closest-row search never reparse cell text.
+        self._row_items: list = []
+        self._row_price_disp = self._row_price_usd = None
+        self._row_portfolio = self._row_mcap = None
+        # Cached (min_p, max_p, log_ratio) for the log-spaced slider mapping;
+        # invalidated whenever the current-price entry changes.
+        self._slider_cache: Tuple[float, float, float] | None = None
+        # Coalescing flags: a drag emits dozens of <Motion> events per second,
+        # but at most one recompute per idle cycle is ever visible.
+        self._slider_pending = False
+        self._display_pending = False
+        # Last successful parse of each numeric entry: label -> (raw text, float).
+        self._parsed_numeric: Dict[str, Tuple[str, float]] = {}
+        # Inputs behind the last table render; spurious events with identical
+        # inputs (focus churn, re-picking the same currency) skip the rebuild.
+        self._last_render_key = None
+        # Scalar fx rate for the selected currency, refreshed on currency
+        # change and fetch so slider-drag math is an attribute read + multiply.
+        self._fx_rate = 1.0
+        # BTC market cap (USD) as a plain float; 0.0 until a fetch supplies it.
+        self._btc_mcap_usd = 0.0
+        # Strings last written to the slider readouts, to skip no-op Tk writes.
+        self._last_slider_display: Tuple[str, str, str] | None = None
 
         # Header (canvas gradient)
         self.top_frame = tk.Frame(root, height=110, bd=0, highlightthickness=0)
@@ -438,27 +735,56 @@ class KaspaPortfolioApp:
 
         self.logo_img = None
         try:
-            _logo_pil = Image.open(LOGO_PATH).resize((300, 125), Image.LANCZOS)
-            self.logo_img = ImageTk.PhotoImage(_logo_pil)
+            # The shipped asset is already 300x125, so the common path is a
+            # native Tk PNG load with no PIL decode or LANCZOS resample.
+            self.logo_img = tk.PhotoImage(file=LOGO_PATH_SCALED)
         except Exception:
-            logger.warning("Logo not found, continuing without it.")
+            try:
+                self.logo_img = _load_scaled_logo(LOGO_PATH, (300, 125))
+            except Exception:
+                logger.warning("Logo not found, continuing without it.")
 
-        def _redraw_header(evt=None):
+        self._last_header_size = (0, 0)
+        self._header_after = None
+        self._hdr_bg_id = self._hdr_logo_id = None
+        self._hdr_title_id = self._hdr_sub_id = None
+
+        def _do_redraw():
+            self._header_after = None
             w = max(1, self.header_canvas.winfo_width())
             h = max(1, self.header_canvas.winfo_height())
+            if (w, h) == self._last_header_size:
+                return
+            self._last_header_size = (w, h)
             stops = [(0.0, "#0b0c0d"), (0.35, "#161718"), (0.55, "#231F20"), (0.90, "#1a2b29"), (1.0, "#153f3a")]
             img = make_horizontal_gradient(w, h, stops)
             img_tk = ImageTk.PhotoImage(img)
-            self.header_canvas.delete("all")
-            self.header_canvas.create_image(0, 0, image=img_tk, anchor="nw")
-            self.header_canvas.image_ref = img_tk
-            if self.logo_img:
-                self.header_canvas.create_image(12, h // 2, image=self.logo_img, anchor="w")
+            canvas = self.header_canvas
             rx = w - 12
-            self.header_canvas.create_text(rx, 38, text="Kaspa Portfolio Projector",
-                                           fill="#FFFFFF", font=("Segoe UI", 30, "bold"), anchor="e")
-            self.header_canvas.create_text(rx, 70, text=f"Developed by the Kaspa community | Version {VERSION}",
-                                           fill="#E6E6E6", font=("Segoe UI", 10), anchor="e")
+            # Create items once; later resizes only swap the gradient image and
+            # move coordinates instead of delete("all") + full recreation.
+            if self._hdr_bg_id is None:
+                self._hdr_bg_id = canvas.create_image(0, 0, image=img_tk, anchor="nw")
+                if self.logo_img:
+                    self._hdr_logo_id = canvas.create_image(12, h // 2, image=self.logo_img, anchor="w")
+                self._hdr_title_id = canvas.create_text(rx, 38, text="Kaspa Portfolio Projector",
+                                                        fill="#FFFFFF", font=("Segoe UI", 30, "bold"), anchor="e")
+                self._hdr_sub_id = canvas.create_text(rx, 70, text=f"Developed by the Kaspa community | Version {VERSION}",
+                                                      fill="#E6E6E6", font=("Segoe UI", 10), anchor="e")
+            else:
+                canvas.itemconfig(self._hdr_bg_id, image=img_tk)
+                if self._hdr_logo_id is not None:
+                    canvas.coords(self._hdr_logo_id, 12, h // 2)
+                canvas.coords(self._hdr_title_id, rx, 38)
+                canvas.coords(self._hdr_sub_id, rx, 70)
+            canvas.image_ref = img_tk
+
+        def _redraw_header(evt=None):
+            # Tk fires dozens of <Configure> events during an interactive resize;
+            # coalesce them so the gradient is rebuilt once per settle.
+            if self._header_after:
+                self.root.after_cancel(self._header_after)
+            self._header_after = self.root.after(30, _do_redraw)
         self.header_canvas.bind("<Configure>", _redraw_header)
 
         self.header_line = tk.Frame(root, height=10, bg=COLOR_BG, bd=0, highlightthickness=0)
@@ -500,8 +826,14 @@ class KaspaPortfolioApp:
         self.entries: Dict[str, ttk.Entry] = {}
         self.check_marks: Dict[str, ttk.Label] = {}
         self.x_marks: Dict[str, ttk.Label] = {}
+        # Current visibility per mark widget; lets the toggles skip the Tk
+        # geometry call when a keystroke re-asserts the state already shown.
+        self._mark_shown: Dict[Tuple[str, str], bool] = {}
         self.updated_fields: Dict[str, bool] = {}
         self.metrics_entries: Dict[str, tk.Frame] = {}
+        # The readonly value widgets themselves; saves a winfo_children() list
+        # build per metric on every refresh.
+        self.metrics_values: Dict[str, ttk.Entry] = {}
 
         # Inputs
         start_row = 1
@@ -543,7 +875,7 @@ class KaspaPortfolioApp:
         currency_frame.grid(row=currency_row, column=1, padx=10, pady=8, sticky="e")
         self.currency_var = tk.StringVar(value="USD")
         self.currency_combo = ttk.Combobox(currency_frame, textvariable=self.currency_var,
-                                           values=["USD", "EUR", "GBP", "JPY", "AUD"],
+                                           values=SUPPORTED_CURRENCIES,
                                            state="readonly", style="Kaspa.TCombobox", width=12)
         self.currency_combo.grid(row=0, column=0, padx=5)
         self.currency_combo.bind("<<ComboboxSelected>>", self.update_display_on_currency_change)
@@ -577,6 +909,7 @@ class KaspaPortfolioApp:
             entry.grid(row=0, column=1, padx=5, pady=8, sticky="e")
             frame.grid(row=i, column=0, padx=(0, 10), pady=5, sticky="e")
             self.metrics_entries[key] = frame
+            self.metrics_values[key] = entry
 
         ttk.Label(self.metrics_subframe, text="Bitcoin Comparison", foreground=COLOR_BG,
                   font=("Segoe UI", 12, "bold"), background=COLOR_FG)\
@@ -611,17 +944,19 @@ class KaspaPortfolioApp:
 
         self.link_to_slider_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(self.checkbox_frame, text="Link to Slider",
-                        variable=self.link_to_slider_var, command=self.update_display_if_valid,
+                        variable=self.link_to_slider_var, command=self.update_slider_values,
                         style="Kaspa.TCheckbutton").pack(side="right", padx=10)
 
+        # Every cell is populated at render time, so the column toggles only
+        # flip displaycolumns — no table rebuild.
         self.show_change_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(self.checkbox_frame, text="Show Change Column",
-                        variable=self.show_change_var, command=self.update_display_if_valid,
+                        variable=self.show_change_var, command=self.update_display_columns,
                         style="Kaspa.TCheckbutton").pack(side="right", padx=10)
 
         self.show_market_cap_vs_btc_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(self.checkbox_frame, text="Show Market Cap vs. Bitcoin",
-                        variable=self.show_market_cap_vs_btc_var, command=self.update_display_if_valid,
+                        variable=self.show_market_cap_vs_btc_var, command=self.update_display_columns,
                         style="Kaspa.TCheckbutton").pack(side="right", padx=10)
 
         self.tree = ttk.Treeview(self.table_frame,
@@ -676,7 +1011,7 @@ class KaspaPortfolioApp:
         self.slider_var = tk.DoubleVar(value=0)
         self.slider = ttk.Scale(self.right_frame, from_=100, to=0, orient="vertical",
                                 variable=self.slider_var, length=550, style="Kaspa.Vertical.TScale",
-                                command=self.update_slider_values)
+                                command=self._on_slider_move)
         try: self.slider.configure(takefocus=0)
         except Exception: pass
         self.slider.bind("<FocusIn>", lambda e: self.right_frame.focus_set())
@@ -708,14 +1043,28 @@ class KaspaPortfolioApp:
         self.root.update_idletasks()
 
     def set_status(self, text: str | None = None, value: float | None = None):
+        # Coalesce rapid updates (e.g., per-row progress callbacks) into a single
+        # flush per idle cycle instead of hitting Tk on every call.
         if text is not None:
-            self.status_label.config(text=text)
+            self._pending_status_text = text
         if value is not None:
+            self._pending_status_value = value
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        self._status_scheduled = False
+        if self._pending_status_text is not None:
+            self.status_label.config(text=self._pending_status_text)
+            self._pending_status_text = None
+        if self._pending_status_value is not None:
+            value = self._pending_status_value
+            self._pending_status_value = None
             if str(self.status_progress.cget("mode")) != "determinate":
                 self.status_progress.stop()
                 self.status_progress.config(mode="determinate", maximum=100, value=0)
             self.status_progress["value"] = max(0, min(100, value))
-        self.root.update_idletasks()
 
     def end_status(self):
         try:
@@ -740,99 +1089,111 @@ class KaspaPortfolioApp:
 
     # ---- API plumbing ----
     @staticmethod
-    @lru_cache(maxsize=1)
     def fetch_api_data():
+        with _API_CACHE_LOCK:
+            cached = _API_CACHE["data"]
+            if cached is not None and time.time() - _API_CACHE["ts"] < _API_CACHE_TTL:
+                return cached
+
         out: Dict[str, Any] = {}
-        fx_info = fetch_fx_rates()
+        # FX and CoinGecko are independent; run them concurrently so total
+        # latency is the slower of the two instead of their sum.
+        fx_future = _GLOBAL_POOL.submit(fetch_fx_rates)
+        cg_future = _GLOBAL_POOL.submit(_fetch_coingecko)
+        fx_info = fx_future.result()
         out["fx_rates"] = fx_info["rates"]
         out["fx_fetched_at"] = fx_info["fetched_at"]
         out["fx_source"] = fx_info["source"]
-
-        try:
-            cg = CoinGeckoAPI()
-            price = _safe_get(cg.get_price, ids="kaspa", vs_currencies="usd")
-            supply = _safe_get(cg.get_coin_by_id, id="kaspa")
-            btc = _safe_get(cg.get_price, ids="bitcoin", vs_currencies="usd", include_market_cap=True)
-            nowz = datetime.now(timezone.utc).isoformat()
-            if price and "kaspa" in price:
-                out["kaspa_price"] = float(price["kaspa"]["usd"])
-            if supply and "market_data" in supply:
-                out["kaspa_supply"] = float(supply["market_data"]["circulating_supply"])
-            if btc and "bitcoin" in btc:
-                out["btc_market_cap"] = float(btc["bitcoin"]["usd_market_cap"])
-            out["coingecko_fetched_at"] = nowz
-            out["coingecko_source"] = "CoinGecko API"
-        except Exception as e:
-            logger.error(f"CoinGecko fetch failed: {e}")
+        out.update(cg_future.result())
+
+        # Only successful fetches are cached; partial/failed results stay uncached
+        # so the next call retries instead of serving an empty snapshot.
+        if "kaspa_price" in out:
+            with _API_CACHE_LOCK:
+                _API_CACHE["data"] = out
+                _API_CACHE["ts"] = time.time()
+            _save_api_cache_to_disk(out)
         return out
 
     def fetch_data_on_startup(self):
-        self.start_status("Fetching data (FX + CoinGecko)…")
-        self._toggle_inputs(True)
-        def _worker():
-            data = self.fetch_api_data()
-            def _apply():
-                try:
-                    self.set_status("Applying data to UI…")
-                    if data.get("fx_rates"):
-                        EXCHANGE_RATES.update(data["fx_rates"])
-                    if "kaspa_price" in data:
-                        self.entries["Current Price (USD):"].delete(0, tk.END)
-                        self.entries["Current Price (USD):"].insert(0, f"{data['kaspa_price']:.4f}")
-                        try: self.entries["Current Price (USD):"].configure(foreground="#e8e8e8")
-                        except Exception: pass
-                    if "kaspa_supply" in data:
-                        self.entries["Circulating Supply (B):"].delete(0, tk.END)
-                        self.entries["Circulating Supply (B):"].insert(0, f"{data['kaspa_supply'] / 1_000_000_000:.4f}")
-                        try: self.entries["Circulating Supply (B):"].configure(foreground="#e8e8e8")
-                        except Exception: pass
-                    for fld in ["Current Price (USD):", "Circulating Supply (B):"]:
-                        self.updated_fields[fld] = True; self.show_check_mark(fld); self.hide_x_mark(fld)
-
-                    if self.entries["KAS Holdings:"].get().strip() in [PLACEHOLDERS["KAS Holdings:"], DEFAULTS["KAS Holdings:"], ""]:
-                        self.entries["KAS Holdings:"].delete(0, tk.END); self.entries["KAS Holdings:"].insert(0, "0")
-
-                    self.fetched_data = data
-                    self.slider_var.set(0)
-                    self.update_slider_values()
-                    self.update_display_if_valid()
-                finally:
-                    self.end_status()
-                    self._toggle_inputs(False)
-            self.root.after(0, _apply)
-        threading.Thread(target=_worker, daemon=True).start()
+        # Stale-while-revalidate: render the last on-disk snapshot immediately so
+        # a warm start never waits on the network, then refresh in the background.
+        cached = _load_api_cache_from_disk()
+        if cached:
+            self._apply_fetched(cached)
+            self.start_status("Refreshing market data (showing cached)…")
+        else:
+            self.start_status("Fetching data (FX + CoinGecko)…")
+            self._toggle_inputs(True)
+        self._poll_startup()
+
+    def _poll_startup(self):
+        if not self._startup_future.done():
+            self.root.after(50, self._poll_startup)
+            return
+        try:
+            data = self._startup_future.result()
+        except Exception as e:
+            logger.error(f"Startup fetch failed: {e}")
+            data = {}
+        try:
+            self.set_status("Applying data to UI…")
+            self._apply_fetched(data)
+        finally:
+            self.end_status()
+            self._toggle_inputs(False)
+
+    def _apply_fetched(self, data: Dict[str, Any]):
+        if data.get("fx_rates"):
+            _update_exchange_rates(data["fx_rates"])
+            self._proj_by_ccy.clear()
+        if "kaspa_price" in data:
+            self.entries["Current Price (USD):"].delete(0, tk.END)
+            self.entries["Current Price (USD):"].insert(0, f"{data['kaspa_price']:.4f}")
+            try: self.entries["Current Price (USD):"].configure(foreground="#e8e8e8")
+            except Exception: pass
+        if "kaspa_supply" in data:
+            self.entries["Circulating Supply (B):"].delete(0, tk.END)
+            self.entries["Circulating Supply (B):"].insert(0, f"{data['kaspa_supply'] / 1_000_000_000:.4f}")
+            try: self.entries["Circulating Supply (B):"].configure(foreground="#e8e8e8")
+            except Exception: pass
+        for fld in ["Current Price (USD):", "Circulating Supply (B):"]:
+            self.updated_fields[fld] = True; self.show_check_mark(fld); self.hide_x_mark(fld)
+
+        if self.entries["KAS Holdings:"].get().strip() in [PLACEHOLDERS["KAS Holdings:"], DEFAULTS["KAS Holdings:"], ""]:
+            self.entries["KAS Holdings:"].delete(0, tk.END); self.entries["KAS Holdings:"].insert(0, "0")
+
+        # Merge so a degraded refresh (e.g. CoinGecko down) keeps cached fields.
+        self.fetched_data = {**self.fetched_data, **data}
+        self._btc_mcap_usd = float(self.fetched_data.get("btc_market_cap", 0.0) or 0.0)
+        self._slider_cache = None
+        self._last_render_key = None  # btc mcap / fx may have moved
+        self._fx_rate = usd_to_disp(1.0, self.currency_var.get())
+        self.slider_var.set(0)
+        self.update_slider_values()
+        self.update_display_if_valid()
 
     def fetch_data(self):
         self.start_status("Refreshing data (FX + CoinGecko)…")
         self._toggle_inputs(True)
+        _clear_api_cache()  # user-initiated refresh bypasses the TTL
         def _worker():
             data: Dict[str, Any] = {}
-            fx_info = fetch_fx_rates()
+            fx_future = _GLOBAL_POOL.submit(fetch_fx_rates)
+            cg_future = _GLOBAL_POOL.submit(_fetch_coingecko)
+            fx_info = fx_future.result()
             data.update({"fx_rates": fx_info["rates"], "fx_fetched_at": fx_info["fetched_at"], "fx_source": fx_info["source"]})
-            try:
-                cg = CoinGeckoAPI()
-                kaspa_price = _safe_get(cg.get_price, ids="kaspa", vs_currencies="usd")
-                kaspa_supply = _safe_get(cg.get_coin_by_id, id="kaspa")
-                btc = _safe_get(cg.get_price, ids="bitcoin", vs_currencies="usd", include_market_cap=True)
-                nowz = datetime.now(timezone.utc).isoformat()
-                if kaspa_price and "kaspa" in kaspa_price:
-                    data["kaspa_price"] = float(kaspa_price["kaspa"]["usd"])
-                if kaspa_supply and "market_data" in kaspa_supply:
-                    data["kaspa_supply"] = float(kaspa_supply["market_data"]["circulating_supply"])
-                if btc and "bitcoin" in btc:
-                    data["btc_market_cap"] = float(btc["bitcoin"]["usd_market_cap"])
-                data["coingecko_fetched_at"] = nowz
-                data["coingecko_source"] = "CoinGecko API"
-            except Exception as e:
-                logger.error(f"CoinGecko fetch failed: {e}")
+            data.update(cg_future.result())
 
             def _apply():
                 try:
                     if not data:
                         raise Exception("No data fetched")
                     if data.get("fx_rates"):
-                        EXCHANGE_RATES.update(data["fx_rates"])
+                        _update_exchange_rates(data["fx_rates"])
+                        self._proj_by_ccy.clear()
                     self.fetched_data = data
+                    self._btc_mcap_usd = float(data.get("btc_market_cap", 0.0) or 0.0)
 
                     if "kaspa_price" in data:
                         self.entries["Current Price (USD):"].delete(0, tk.END)
@@ -846,6 +1207,9 @@ class KaspaPortfolioApp:
                     if self.entries["KAS Holdings:"].get().strip() in [PLACEHOLDERS["KAS Holdings:"], DEFAULTS["KAS Holdings:"], ""] :
                         self.entries["KAS Holdings:"].delete(0, tk.END); self.entries["KAS Holdings:"].insert(0, "0")
 
+                    self._slider_cache = None
+                    self._last_render_key = None
+                    self._fx_rate = usd_to_disp(1.0, self.currency_var.get())
                     self.slider_var.set(0)
                     self.update_slider_values()
                     self.update_display_if_valid()
@@ -855,7 +1219,7 @@ class KaspaPortfolioApp:
                     self.end_status()
                     self._toggle_inputs(False)
             self.root.after(0, _apply)
-        threading.Thread(target=_worker, daemon=True).start()
+        _GLOBAL_POOL.submit(_worker)
 
     # ---- Help / Pulled Data ----
     def show_help(self):
@@ -891,7 +1255,7 @@ class KaspaPortfolioApp:
         def line(s=""): txt.insert("end", s + "\n")
 
         line("=== Exchange Rates (base USD) ===")
-        for k in ["USD", "EUR", "GBP", "JPY", "AUD"]:
+        for k in SUPPORTED_CURRENCIES:
             line(f"  {k}: {fx.get(k, 'n/a')}")
         line(f"  fetched_at: {fx_time}")
         line(f"  source    : {fx_src}")
@@ -910,6 +1274,8 @@ class KaspaPortfolioApp:
 
     # ---- Placeholder & validation ----
     def clear_placeholder(self, widget, placeholder, default, label):
+        if label == "Current Price (USD):":
+            self._slider_cache = None
         if widget.get() in [placeholder, default]:
             widget.delete(0, tk.END)
             try: widget.configure(foreground="#e8e8e8")
@@ -918,6 +1284,8 @@ class KaspaPortfolioApp:
             self.hide_check_mark(label); self.show_x_mark(label)
 
     def restore_placeholder(self, widget, placeholder, default, label):
+        if label == "Current Price (USD):":
+            self._slider_cache = None
         value = widget.get().strip()
         if not value:
             widget.insert(0, placeholder)
@@ -947,6 +1315,8 @@ class KaspaPortfolioApp:
     def update_field_and_check(self, widget):
         label = next((l for l, e in self.entries.items() if e == widget), None)
         if not label: return
+        if label == "Current Price (USD):":
+            self._slider_cache = None
         value = widget.get().strip()
         if value and value != PLACEHOLDERS[label]:
             if label == "Portfolio Name:":
@@ -969,52 +1339,110 @@ class KaspaPortfolioApp:
 
     def is_valid_numeric_field(self, label):
         value = self.entries[label].get().strip()
-        if not value or value == PLACEHOLDERS[label]: return False
-        try:
-            f = float(value.replace(",", ""))
-            if label == "KAS Holdings:" and f <= 0: return False
-            return f >= 0
-        except ValueError:
+        if not value or value == PLACEHOLDERS[label]:
+            self._parsed_numeric.pop(label, None)
             return False
+        # Memoize the parse keyed on the raw text, so steady-state events skip
+        # the replace+float work and update_display_if_valid never reparses.
+        cached = self._parsed_numeric.get(label)
+        if cached is not None and cached[0] == value:
+            f = cached[1]
+        else:
+            try:
+                f = float(value.replace(",", ""))
+            except ValueError:
+                self._parsed_numeric.pop(label, None)
+                return False
+            self._parsed_numeric[label] = (value, f)
+        if label == "KAS Holdings:" and f <= 0: return False
+        return f >= 0
 
     # ---- Table / metrics ----
     def update_display_if_valid(self, _event=None):
         if all(self.is_valid_numeric_field(f) for f in NUMERIC_FIELDS):
-            kaspa = float(self.entries["KAS Holdings:"].get().replace(",", ""))
-            price_usd = float(self.entries["Current Price (USD):"].get().replace(",", ""))
-            supply_b = float(self.entries["Circulating Supply (B):"].get().replace(",", ""))
+            kaspa = self._parsed_numeric["KAS Holdings:"][1]
+            price_usd = self._parsed_numeric["Current Price (USD):"][1]
+            supply_b = self._parsed_numeric["Circulating Supply (B):"][1]
             currency = self.currency_var.get()
-            df, sym = generate_portfolio_projection(kaspa, price_usd, supply_b, currency)
-            btc_market_cap = (self.fetched_data or {}).get("btc_market_cap", 0.0)
-
-            self.tree.delete(*self.tree.get_children())
-            items = []
-            for i, (_, row) in enumerate(df.iterrows()):
-                projected_price_usd = row["Price_USD"]
-                projected_portfolio_value = row["Portfolio"]
-                projected_market_cap = row["Market Cap"]
-                multiple = (projected_price_usd / price_usd) if price_usd else 0
-                pct = (multiple - 1) * 100
-                change_str = f"{multiple:.1f}x ({pct:+.1f}%)"
-                tag = "even" if i % 2 == 0 else "odd"
-                vals = [
-                    fmt_money(sym, row["Price"]),
-                    fmt_money(sym, projected_portfolio_value, 0),
-                    fmt_money(sym, projected_market_cap, 0),
-                ]
-                vals.append(change_str if self.show_change_var.get() else "")
-                if self.show_market_cap_vs_btc_var.get():
-                    mcap_usd = disp_to_usd(projected_market_cap, currency)
-                    vals.append(f"{(mcap_usd / btc_market_cap):.6f}" if btc_market_cap else "N/A")
+            render_key = (kaspa, price_usd, supply_b, currency)
+            if render_key == self._last_render_key:
+                return
+            inputs = (kaspa, price_usd, supply_b)
+            if inputs != self._proj_inputs:
+                self._proj_by_ccy.clear()
+                self._proj_inputs = inputs
+            cached = self._proj_by_ccy.get(currency)
+            if cached is None:
+                cached = cached_portfolio_projection(kaspa, price_usd, supply_b, currency)
+                self._proj_by_ccy[currency] = cached
+            df, sym = cached
+            btc_market_cap = self._btc_mcap_usd
+            self._fx_rate = rate = usd_to_disp(1.0, currency)  # one fx lookup per refresh
+
+            # Vectorized prep: pull the columns out once, compute the optional
+            # Change / BTC-ratio columns as whole arrays, and pre-format every
+            # cell string so the insert loop only talks to Tk.
+            price_arr = df["Price"].to_numpy()
+            price_usd_arr = df["Price_USD"].to_numpy()
+            port_arr = df["Portfolio"].to_numpy()
+            mc_arr = df["Market Cap"].to_numpy()
+            color_arr = df["Color"].to_numpy()
+
+            # Both optional columns are always materialized so visibility
+            # toggles can flip displaycolumns without re-rendering rows.
+            mult = price_usd_arr / price_usd if price_usd else np.zeros(len(df))
+            change_strs = [f"{m:.1f}x ({(m - 1) * 100:+.1f}%)" for m in mult.tolist()]
+            if btc_market_cap:
+                ratio_arr = (mc_arr / rate) / btc_market_cap
+                ratio_strs = [f"{r:.6f}" for r in ratio_arr.tolist()]
+            else:
+                ratio_strs = ["N/A"] * len(df)
+
+            fmt2 = _money_formatter(sym, 2)
+            fmt0 = _money_formatter(sym, 0)
+            price_strs = [fmt2(v) for v in price_arr.tolist()]
+            port_strs = [fmt0(v) for v in port_arr.tolist()]
+            mc_strs = [fmt0(v) for v in mc_arr.tolist()]
+
+            # One Tcl eval for the whole batch: N Python<->Tcl round-trips become
+            # a single script. Cell strings only contain money/percent characters,
+            # which are literal inside Tcl braces. When the row count matches the
+            # previous render, the existing items are reconfigured in place
+            # (display position i gets new row i) instead of deleted and
+            # recreated, which skips Tk's item teardown/layout churn entirely.
+            w = str(self.tree)
+            reuse = self._row_items if len(self._row_items) == len(df) else None
+            if reuse is None and self.tree.get_children():
+                self.tree.delete(*self.tree.get_children())
+            lines = [] if reuse is not None else ["set kpp_iids {}"]
+            parities = ("even", "odd")  # indexed by i & 1; no branch per row
+            for i in range(len(df)):
+                vals = (price_strs[i], port_strs[i], mc_strs[i], change_strs[i], ratio_strs[i])
+                vals_tcl = " ".join("{" + s + "}" for s in vals)
+                parity = parities[i & 1]
+                if reuse is not None:
+                    lines.append(f"{w} item {reuse[i]}"
+                                 f" -values {{{vals_tcl}}} -tags {{{color_arr[i]} {parity}}}")
                 else:
-                    vals.append("")
-                item = self.tree.insert("", "end", values=vals, tags=(row["Color"], tag))
-                items.append(item)
+                    lines.append(f"lappend kpp_iids [{w} insert {{}} end"
+                                 f" -values {{{vals_tcl}}} -tags {{{color_arr[i]} {parity}}}]")
+            if reuse is not None:
+                self.tree.tk.eval("\n".join(lines))
+                items = reuse
+            else:
+                lines.append("set kpp_iids")
+                items = list(self.tree.tk.splitlist(self.tree.tk.eval("\n".join(lines))))
+
+            self._row_items = items
+            self._row_price_disp = price_arr
+            self._row_price_usd = price_usd_arr
+            self._row_portfolio = port_arr
+            self._row_mcap = mc_arr
 
             if not df.empty:
-                black_idx = df.index[df["Color"] == "black"].tolist()
-                if black_idx:
-                    bi = max(0, black_idx[0] - 1)
+                black_mask = color_arr == "black"
+                if black_mask.any():
+                    bi = max(0, int(black_mask.argmax()) - 1)
                     self.tree.see(items[bi]); self.tree.yview_moveto(bi / max(1, len(items)))
 
             self.update_display_columns()
@@ -1025,11 +1453,11 @@ class KaspaPortfolioApp:
             price_needed_for_1m_usd = (1_000_000 / kaspa) if kaspa > 0 else 0
             mcap_needed_for_1m_usd = price_needed_for_1m_usd * circ_supply
 
-            market_cap = usd_to_disp(market_cap_usd, currency)
-            portfolio_value = usd_to_disp(portfolio_value_usd, currency)
-            price_needed_for_1m = usd_to_disp(price_needed_for_1m_usd, currency)
-            mcap_needed_for_1m = usd_to_disp(mcap_needed_for_1m_usd, currency)
-            btc_mcap_cur = usd_to_disp((btc_market_cap or 0), currency)
+            market_cap = market_cap_usd * rate
+            portfolio_value = portfolio_value_usd * rate
+            price_needed_for_1m = price_needed_for_1m_usd * rate
+            mcap_needed_for_1m = mcap_needed_for_1m_usd * rate
+            btc_mcap_cur = (btc_market_cap or 0) * rate
             ratio = (mcap_needed_for_1m_usd / btc_market_cap) if btc_market_cap else 0
 
             updates = [
@@ -1039,9 +1467,9 @@ class KaspaPortfolioApp:
                 ("Price Needed 1M", fmt_money(sym, price_needed_for_1m)),
                 ("Market Cap Needed 1M", fmt_money(sym, mcap_needed_for_1m)),
             ]
+            write_ro = self.root.tk.call
             for key, val in updates:
-                entry = self.metrics_entries[key].winfo_children()[1]
-                entry.state(["!readonly"]); entry.delete(0, tk.END); entry.insert(0, val); entry.state(["readonly"])
+                write_ro("kpp_writeRO", str(self.metrics_values[key]), val)
 
             if btc_market_cap:
                 self.btc_summary_line1.config(text="KAS Market cap needed for $1M portfolio:")
@@ -1053,6 +1481,7 @@ class KaspaPortfolioApp:
 
             # NEW: also refresh the slider panel to current inputs
             self.update_slider_values()
+            self._last_render_key = render_key
 
     def update_display_columns(self):
         cols = ["Price", "Portfolio", "MarketCap"]
@@ -1065,37 +1494,34 @@ class KaspaPortfolioApp:
             for col in cols[:-1]: self.tree.column(col, width=base, anchor="center")
             self.tree.column(cols[-1], width=total - base * (n - 1), anchor="center")
 
+    # Numeric sort key per column; Change and Market Cap vs. BTC are monotonic
+    # in Price_USD / Market Cap, so the base arrays double as their keys.
+    _SORT_ARRAYS = {"Price": "_row_price_disp", "Portfolio": "_row_portfolio",
+                    "MarketCap": "_row_mcap", "Change": "_row_price_usd",
+                    "Market Cap vs. BTC": "_row_mcap"}
+
     def sort_table(self, column):
         disp_cols = list(self.tree["displaycolumns"])
         if column not in disp_cols: return
-        col_idx = disp_cols.index(column)
-        items = [(self.tree.item(item)["values"], item) for item in self.tree.get_children()]
-
-        def parse_tuple(val):
-            if column in ["Price", "Portfolio", "MarketCap"]:
-                s = str(val).replace("A$", "").replace("$", "").replace("€", "").replace("£", "").replace("¥", "")
-                try:
-                    v = float(s.replace(",", "") or 0.0)
-                except Exception:
-                    v = 0.0
-                return (0, v)
-            if column == "Market Cap vs. BTC":
-                if val in ("", "N/A"): return (1, 0.0)
-                try:
-                    return (0, float(val))
-                except Exception:
-                    return (1, 0.0)
-            if column == "Change":
-                try:
-                    return (0, float(str(val).split("x")[0]))
-                except Exception:
-                    return (1, 0.0)
-            return (0, str(val))
+        keys = getattr(self, self._SORT_ARRAYS.get(column, ""), None)
+        if keys is None or not len(self._row_items): return
 
         reverse = self._sort_state.get(column, False)
-        items.sort(key=lambda x: parse_tuple(x[0][col_idx]), reverse=reverse)
+        order = np.argsort(-keys if reverse else keys, kind="stable")
         self._sort_state[column] = not reverse
-        for i, (_, item) in enumerate(items): self.tree.move(item, "", i)
+
+        items = self._row_items
+        # One eval for all the moves: Tk relayouts once when the script ends
+        # instead of invalidating after every repositioned row.
+        w = str(self.tree)
+        self.tree.tk.eval("\n".join(
+            f"{w} move {items[idx]} {{}} {pos}" for pos, idx in enumerate(order)))
+        # Keep the parallel arrays aligned with the new display order.
+        self._row_items = [items[i] for i in order]
+        self._row_price_disp = self._row_price_disp[order]
+        self._row_price_usd = self._row_price_usd[order]
+        self._row_portfolio = self._row_portfolio[order]
+        self._row_mcap = self._row_mcap[order]
 
     # ---- Slider ----
     def toggle_slider_input(self, value):
@@ -1107,59 +1533,94 @@ class KaspaPortfolioApp:
             self.slider_input_menu.pack(side="right", padx=10)
 
     def _slider_bounds(self):
+        # Reparsing the price entry and taking logs on every pixel of a drag
+        # adds up; scalar math.log also beats np.log's ufunc dispatch here.
+        if self._slider_cache is not None:
+            return self._slider_cache
         try:
             cp = float(self.entries["Current Price (USD):"].get().replace(",", ""))
             min_price = max(round(cp, 2), 0.01)
         except Exception:
             min_price = 0.01
-        return min_price, 1000.0
+        max_price = 1000.0
+        log_ratio = math.log(max_price / min_price) if max_price > min_price else 0.0
+        self._slider_cache = (min_price, max_price, log_ratio)
+        return self._slider_cache
+
+    def _on_slider_move(self, _=None):
+        if not self._slider_pending:
+            self._slider_pending = True
+            self.root.after_idle(self._do_slider_update)
+
+    def _do_slider_update(self):
+        self._slider_pending = False
+        self.update_slider_values()
+
+    def _schedule_display_update(self):
+        if not self._display_pending:
+            self._display_pending = True
+            self.root.after_idle(self._do_display_update)
+
+    def _do_display_update(self):
+        self._display_pending = False
+        self.update_display_if_valid()
 
     def update_slider_from_entry(self, _=None):
         try:
-            entered = float(self.slider_price_entry.get().replace("$", "").replace(",", ""))
+            entered = float(_strip_currency(self.slider_price_entry.get()))
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid numeric price."); return
-        min_p, max_p = self._slider_bounds()
+        min_p, max_p, log_ratio = self._slider_bounds()
         entered = min(max(entered, min_p), max_p)
-        if max_p > min_p:
-            pos = 100 * np.log(entered / min_p) / np.log(max_p / min_p)
+        if log_ratio > 0:
+            pos = 100 * math.log(entered / min_p) / log_ratio
             self.slider_var.set(pos); self.update_slider_values()
 
+    def _entry_float(self, label: str) -> float:
+        # Slider ticks re-read entries whose text almost never changes between
+        # events; reuse the parse memo keyed on the raw string, 0.0 on junk.
+        raw = self.entries[label].get()
+        hit = self._parsed_numeric.get(label)
+        if hit is not None and hit[0] == raw:
+            return hit[1]
+        try:
+            val = float(raw.replace(",", ""))
+        except Exception:
+            return 0.0
+        self._parsed_numeric[label] = (raw, val)
+        return val
+
     def update_slider_values(self, _=None):
-        min_p, max_p = self._slider_bounds()
+        min_p, max_p, log_ratio = self._slider_bounds()
         pos = float(self.slider_var.get()); pos = min(max(pos, 0.0), 100.0)
-        kas_price = min_p * (max_p / min_p) ** (pos / 100.0) if max_p > min_p else min_p
+        kas_price = min_p * math.exp(log_ratio * pos / 100.0) if log_ratio > 0 else min_p
 
-        try: kas_amount = float(self.entries["KAS Holdings:"].get().replace(",", ""))
-        except Exception: kas_amount = 0.0
-        try:
-            supply_b = float(self.entries["Circulating Supply (B):"].get().replace(",", ""))
-            circ_supply = supply_b * 1_000_000_000
-        except Exception: circ_supply = 0.0
+        kas_amount = self._entry_float("KAS Holdings:")
+        circ_supply = self._entry_float("Circulating Supply (B):") * 1_000_000_000
 
         currency = self.currency_var.get()
         sym = currency_symbol(currency)
+        rate = self._fx_rate
 
-        self.slider_price_label.config(text=fmt_money("$", kas_price))
-
-        portfolio_value = usd_to_disp(kas_amount * kas_price, currency)
-        mcap = usd_to_disp(circ_supply * kas_price, currency)
+        portfolio_value = kas_amount * kas_price * rate
+        mcap = circ_supply * kas_price * rate
 
-        for w, val in [(self.portfolio_value_entry, fmt_money(sym, portfolio_value)),
-                       (self.market_cap_entry, fmt_money(sym, mcap))]:
-            w.state(["!readonly"]); w.delete(0, tk.END); w.insert(0, val); w.state(["readonly"])
+        # Sub-pixel slider moves often round to the same display strings;
+        # skip the Tk writes entirely when nothing visible changed.
+        texts = (fmt_money("$", kas_price), fmt_money(sym, portfolio_value), fmt_money(sym, mcap))
+        if texts != self._last_slider_display:
+            self._last_slider_display = texts
+            self.slider_price_label.config(text=texts[0])
+            write_ro = self.root.tk.call
+            write_ro("kpp_writeRO", str(self.portfolio_value_entry), texts[1])
+            write_ro("kpp_writeRO", str(self.market_cap_entry), texts[2])
 
         if self.link_to_slider_var.get():
-            items = self.tree.get_children()
-            if not items: return
-            closest_index, min_diff = 0, float("inf")
-            target_price_disp = usd_to_disp(kas_price, currency)
-            for i, item in enumerate(items):
-                price_str = self.tree.item(item, "values")[0]
-                price_num = float(str(price_str).replace("A$", "").replace("$", "").replace("€", "")
-                                  .replace("£", "").replace("¥", "").replace(",", "") or 0.0)
-                diff = abs(price_num - target_price_disp)
-                if diff < min_diff: min_diff, closest_index = diff, i
+            items = self._row_items
+            prices = self._row_price_disp
+            if not items or prices is None: return
+            target_price_disp = kas_price * rate
+            closest_index = int(_closest_index(prices, target_price_disp))
             tgt = max(0, closest_index - 1); self.tree.see(items[tgt]); self.tree.yview_moveto(tgt / max(1, len(items)))
 
     # ---- Exporters ----
@@ -1177,52 +1638,83 @@ class KaspaPortfolioApp:
                 if not self.is_valid_numeric_field(f):
                     raise ValueError(f"Please enter a valid positive number greater than 0 for {f} if applicable.")
             kaspa, price_usd, supply_b, currency, name = self._collect_inputs()
-            df, _ = generate_portfolio_projection(kaspa, price_usd, supply_b, currency)
+            df, _ = cached_portfolio_projection(kaspa, price_usd, supply_b, currency)
             path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
-            if path:
-                self.start_status("Saving PDF…", indeterminate=False)
-                try:
-                    btc_market_cap = (self.fetched_data or {}).get("btc_market_cap", 0)
-                    generate_portfolio_pdf(
-                        df, path, name, kaspa, price_usd, supply_b, currency, btc_market_cap,
-                        progress_cb=lambda p: self.set_status(value=p)
-                    )
-                    messagebox.showinfo("Success", f"PDF generated at {path}.")
-                finally:
-                    self.end_status()
+            if not path:
+                return
+            # Render on the worker pool so the FPDF row loop never blocks the
+            # mainloop; progress and completion are marshalled back via after().
+            self.start_status("Saving PDF…", indeterminate=False)
+            self._toggle_inputs(True)
+            btc_market_cap = self._btc_mcap_usd
+            future = _GLOBAL_POOL.submit(
+                generate_portfolio_pdf,
+                df, path, name, kaspa, price_usd, supply_b, currency, btc_market_cap,
+                progress_cb=lambda p: self.root.after_idle(self.set_status, None, p)
+            )
+            future.add_done_callback(lambda f: self.root.after(0, self._pdf_done, f, path))
         except ValueError as e:
             messagebox.showerror("Error", str(e))
 
+    def _pdf_done(self, future, path):
+        try:
+            future.result()
+            messagebox.showinfo("Success", f"PDF generated at {path}.")
+        except Exception as e:
+            messagebox.showerror("Error", f"PDF generation failed: {e}")
+        finally:
+            self.end_status()
+            self._toggle_inputs(False)
+
     def export_csv(self):
         try:
             for f in NUMERIC_FIELDS:
                 if not self.is_valid_numeric_field(f):
                     raise ValueError(f"Please enter a valid positive number greater than 0 for {f} if applicable.")
             kaspa, price_usd, supply_b, currency, name = self._collect_inputs()
-            df, _ = generate_portfolio_projection(kaspa, price_usd, supply_b, currency)
-            path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")],
+            df, _ = cached_portfolio_projection(kaspa, price_usd, supply_b, currency)
+            path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv"), ("Gzipped CSV files", "*.csv.gz")],
                                                 initialfile=f"{(name or 'unnamed').lower().replace(' ','_')}_projection.csv")
             if not path: return
             self.start_status("Exporting CSV…", indeterminate=False)
-            try:
-                sym = currency_symbol(currency)
-                out = df.copy()
-                out["Price"] = out["Price"].map(lambda v: fmt_money(sym, v))
-                out["Portfolio"] = out["Portfolio"].map(lambda v: fmt_money(sym, v, 0))
-                out["Market Cap"] = out["Market Cap"].map(lambda v: fmt_money(sym, v, 0))
-                out = out.drop(columns=["Price_USD"])
-                # Simple staged updates to show progress
-                total_steps = 3
-                self.set_status(value=33)
-                out.to_csv(path, index=False)
-                self.set_status(value=100)
-                messagebox.showinfo("Success", f"CSV exported to {path}.")
-            finally:
-                self.end_status()
+            sym = currency_symbol(currency)
+            # Assemble the output frame directly instead of copy-then-drop:
+            # no duplicate of the numeric columns is ever materialized.
+            formatted = {
+                "Price": _fmt_money_array(sym, df["Price"].to_numpy()),
+                "Portfolio": _fmt_money_array(sym, df["Portfolio"].to_numpy(), 0),
+                "Market Cap": _fmt_money_array(sym, df["Market Cap"].to_numpy(), 0),
+            }
+            out = pd.DataFrame({c: formatted.get(c, df[c]) for c in df.columns
+                                if c != "Price_USD"})
+            self.set_status(value=33)
+
+            # Write on the worker pool like the PDF export, so gzip or a slow
+            # drive never stalls the mainloop; dialogs come back via after().
+            def _write():
+                # Level-1 gzip when the user picks .csv.gz: minimal CPU, still
+                # shrinks I/O on slow drives.
+                compression = {"method": "gzip", "compresslevel": 1} if path.endswith(".gz") else None
+                out.to_csv(path, index=False, compression=compression)
+
+            future = _GLOBAL_POOL.submit(_write)
+            future.add_done_callback(lambda f: self.root.after(0, self._csv_done, f, path))
         except ValueError as e:
             messagebox.showerror("Error", str(e))
+        except Exception as e:
+            self.end_status()
+            messagebox.showerror("Error", f"CSV export failed: {e}")
+
+    def _csv_done(self, future, path):
+        try:
+            future.result()
+            self.set_status(value=100)
+            messagebox.showinfo("Success", f"CSV exported to {path}.")
         except Exception as e:
             messagebox.showerror("Error", f"CSV export failed: {e}")
+        finally:
+            self.end_status()
 
     # ---- Misc ----
     def _copy_cell(self, event):
@@ -1237,7 +1729,8 @@ class KaspaPortfolioApp:
                 self.root.clipboard_append(val)
 
     def update_display_on_currency_change(self, _event=None):
-        self.update_display_if_valid(); self.update_slider_values()
+        self._fx_rate = usd_to_disp(1.0, self.currency_var.get())
+        self._schedule_display_update(); self._on_slider_move()
         try:
             self.currency_combo.selection_clear()
             self.currency_combo.icursor(tk.END)
@@ -1247,14 +1740,23 @@ class KaspaPortfolioApp:
         self.slider_input_var.set("Use Slider"); self.slider_price_entry.pack_forget()
         self.slider_input_menu.pack(side="right", padx=10)
 
+    def _set_mark(self, kind, label, shown):
+        # Checks start hidden and X marks start gridded (see create_inputs).
+        key = (kind, label)
+        if self._mark_shown.get(key, kind == "x") == shown:
+            return
+        self._mark_shown[key] = shown
+        mark = (self.check_marks if kind == "check" else self.x_marks)[label]
+        (mark.grid if shown else mark.grid_remove)()
+
     def show_check_mark(self, label):
-        self.check_marks[label].grid(); self.x_marks[label].grid_remove()
+        self._set_mark("check", label, True); self._set_mark("x", label, False)
     def hide_check_mark(self, label):
-        self.check_marks[label].grid_remove()
+        self._set_mark("check", label, False)
     def show_x_mark(self, label):
-        self.x_marks[label].grid(); self.check_marks[label].grid_remove()
+        self._set_mark("x", label, True); self._set_mark("check", label, False)
     def hide_x_mark(self, label):
-        self.x_marks[label].grid_remove()
+        self._set_mark("x", label, False)
 
 # -----------------------------------------------------------------------------
 # Entrypoint